@@ -1,97 +1,136 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import pickle
+import re
+import stat
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Mapping
 
-from pydantic import BaseModel, Field, ValidationError, model_validator, field_validator
-
 from .exceptions import ConfigError
 
 CONFIG_ENV_PREFIX = "MCP_BEANCOUNT_"
 DEFAULT_CONFIG_FILENAMES = ("mcp-beancount.toml", ".mcp-beancount.toml")
 
+_TRUE_SET = frozenset({"1", "true", "yes", "on"})
 
-class AppConfig(BaseModel):
-    """Runtime configuration for the MCP Beancount server."""
 
-    ledger_path: Path = Field(description="Path to the root Beancount ledger file.")
-    default_currency: str | None = Field(
-        default=None,
-        description="Default currency to use for valuations when none is supplied.",
-    )
-    timezone: str = Field(default="UTC", description="Local timezone identifier for date handling.")
-    locale: str | None = Field(default=None, description="Locale used when formatting responses.")
-    backup_dir: Path | None = Field(
-        default=None,
-        description="Directory where timestamped ledger backups will be written.",
-    )
-    backup_retention: int | None = Field(
-        default=10,
-        ge=0,
-        description="Maximum number of backups to keep (0 = unlimited).",
-    )
-    lock_timeout: float = Field(default=10.0, ge=0.1, description="Seconds to wait for the ledger file lock.")
-    dry_run_default: bool = Field(default=False, description="Whether tools should default to dry-run mode.")
-    http_host: str = Field(default="127.0.0.1", description="HTTP host for the MCP server.")
-    http_port: int = Field(default=8765, ge=1, le=65535, description="HTTP port for the MCP server.")
-    http_path: str = Field(default="/mcp", description="HTTP path prefix for the MCP transport.")
-    enable_nl: bool = Field(default=True, description="Enable the natural-language BeanQuery tool.")
+def _to_bool(value: str) -> bool:
+    return value.lower() in _TRUE_SET
+
+
+_SPLIT_CSV = re.compile(r"[,\s]+").split
+
+
+def _split_csv(value: str) -> list[str]:
+    # Comma or space separated list, split in a single pass.
+    return [part for part in _SPLIT_CSV(value.strip()) if part]
+
+
+def _default_scopes() -> list[str]:
+    return ["openid", "https://www.googleapis.com/auth/userinfo.email"]
+
+
+# Environment override spec: env-var suffix -> (config field, coercion).
+# Built once at import so load_config does a single pass over the variables
+# that are actually set instead of probing every known key.
+_ENV_SPEC: dict[str, tuple[str, Any]] = {
+    "LEDGER": ("ledger_path", str),
+    "LEDGER_PATH": ("ledger_path", str),
+    "DEFAULT_CURRENCY": ("default_currency", str),
+    "TIMEZONE": ("timezone", str),
+    "LOCALE": ("locale", str),
+    "BACKUP_DIR": ("backup_dir", str),
+    "BACKUP_RETENTION": ("backup_retention", int),
+    "LOCK_TIMEOUT": ("lock_timeout", float),
+    "DRY_RUN_DEFAULT": ("dry_run_default", _to_bool),
+    "STRICT_VALIDATION": ("strict_validation", _to_bool),
+    "HTTP_HOST": ("http_host", str),
+    "HTTP_PORT": ("http_port", int),
+    "HTTP_PATH": ("http_path", str),
+    "ENABLE_NL": ("enable_nl", _to_bool),
+    # Google OAuth
+    "GOOGLE_AUTH_ENABLED": ("google_auth_enabled", _to_bool),
+    "GOOGLE_CLIENT_ID": ("google_client_id", str),
+    "GOOGLE_CLIENT_SECRET": ("google_client_secret", str),
+    "GOOGLE_BASE_URL": ("google_base_url", str),
+    "GOOGLE_REQUIRED_SCOPES": ("google_required_scopes", _split_csv),
+    "GOOGLE_REDIRECT_PATH": ("google_redirect_path", str),
+    "GOOGLE_ALLOWED_EMAILS": ("google_allowed_emails", _split_csv),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """Runtime configuration for the MCP Beancount server.
+
+    A plain frozen dataclass: the config is built once per process and the
+    few checks it needs (range guards, path normalisation) run inline in
+    ``__post_init__``, so there is no validation framework on the startup path.
+    """
+
+    ledger_path: Path
+    default_currency: str | None = None
+    timezone: str = "UTC"
+    locale: str | None = None
+    backup_dir: Path | None = None
+    backup_retention: int | None = 10
+    lock_timeout: float = 10.0
+    dry_run_default: bool = False
+    strict_validation: bool = False
+    http_host: str = "127.0.0.1"
+    http_port: int = 8765
+    http_path: str = "/mcp"
+    enable_nl: bool = True
 
     # Optional Google OAuth authentication for HTTP transports
-    google_auth_enabled: bool = Field(
-        default=False,
-        description="Enable Google OAuth authentication for HTTP endpoints.",
-    )
-    google_client_id: str | None = Field(
-        default=None, description="Google OAuth Client ID (required if auth enabled)."
-    )
-    google_client_secret: str | None = Field(
-        default=None, description="Google OAuth Client Secret (required if auth enabled)."
-    )
-    google_base_url: str | None = Field(
-        default=None,
-        description=(
-            "Base URL where the server is reachable for OAuth redirects. "
-            "Defaults to http://{http_host}:{http_port} if not set."
-        ),
-    )
-    google_required_scopes: list[str] = Field(
-        default_factory=lambda: [
-            "openid",
-            "https://www.googleapis.com/auth/userinfo.email",
-        ],
-        description="OAuth scopes to request from Google.",
-    )
-    google_redirect_path: str | None = Field(
-        default=None,
-        description="Optional OAuth redirect path (defaults to provider's /auth/callback).",
-    )
-    google_allowed_emails: list[str] = Field(
-        default_factory=list,
-        description="Comma- or list-defined email allowlist. Empty list means allow all authenticated users.",
-    )
+    google_auth_enabled: bool = False
+    google_client_id: str | None = None
+    google_client_secret: str | None = None
+    google_base_url: str | None = None
+    google_required_scopes: list[str] = field(default_factory=_default_scopes)
+    google_redirect_path: str | None = None
+    google_allowed_emails: list[str] = field(default_factory=list)
+    google_allowed_emails_set: frozenset[str] = field(default_factory=frozenset)
 
-    @field_validator("google_allowed_emails", mode="before")
-    @staticmethod
-    def _parse_allowed_emails(value: Any) -> list[str] | Any:
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return [part.strip() for part in value.replace(" ", ",").split(",") if part.strip()]
-        return value
+    def __post_init__(self) -> None:
+        self._check_ranges()
+        self._normalise_paths()
 
-    model_config = {"validate_assignment": True}
+    @property
+    def resolved_base_url(self) -> str:
+        """Base URL for OAuth redirects, defaulting to the HTTP bind address."""
+
+        return self.google_base_url or f"http://{self.http_host}:{self.http_port}"
+
+    def _check_ranges(self) -> None:
+        if isinstance(self.ledger_path, str):
+            object.__setattr__(self, "ledger_path", Path(self.ledger_path))
+        if isinstance(self.backup_dir, str):
+            object.__setattr__(self, "backup_dir", Path(self.backup_dir))
+        if isinstance(self.google_allowed_emails, str):
+            object.__setattr__(self, "google_allowed_emails", _split_csv(self.google_allowed_emails))
+        if self.backup_retention is not None and self.backup_retention < 0:
+            raise ConfigError("backup_retention must be >= 0.")
+        if self.lock_timeout < 0.1:
+            raise ConfigError("lock_timeout must be >= 0.1 seconds.")
+        if not 1 <= self.http_port <= 65535:
+            raise ConfigError("http_port must be between 1 and 65535.")
 
-    @model_validator(mode="after")
     def _normalise_paths(self) -> "AppConfig":
         ledger_path = self.ledger_path.expanduser().resolve()
-        if not ledger_path.exists():
-            raise ConfigError(f"Configured ledger file does not exist: {ledger_path}")
-        if not ledger_path.is_file():
+        try:
+            ledger_stat = os.stat(ledger_path)
+        except OSError as exc:
+            raise ConfigError(f"Configured ledger file does not exist: {ledger_path}") from exc
+        if not stat.S_ISREG(ledger_stat.st_mode):
             raise ConfigError(f"Configured ledger path is not a file: {ledger_path}")
 
         backup_dir = self.backup_dir or ledger_path.parent / ".backups"
+        # The dataclass is frozen, so normalisation writes bypass __setattr__.
         object.__setattr__(self, "ledger_path", ledger_path)
         object.__setattr__(self, "backup_dir", backup_dir.expanduser().resolve())
 
@@ -101,22 +140,77 @@ class AppConfig(BaseModel):
                 raise ConfigError(
                     "Google auth enabled but google_client_id/google_client_secret are not configured."
                 )
-            if not self.google_base_url:
-                object.__setattr__(
-                    self,
-                    "google_base_url",
-                    f"http://{self.http_host}:{self.http_port}",
-                )
-            normalized = [email.strip().lower() for email in self.google_allowed_emails if email.strip()]
+            normalized = [
+                stripped.casefold()
+                for email in self.google_allowed_emails
+                if (stripped := email.strip())
+            ]
             object.__setattr__(self, "google_allowed_emails", normalized)
+            object.__setattr__(self, "google_allowed_emails_set", frozenset(normalized))
         return self
 
 
-def _load_toml_config(path: Path) -> dict[str, Any]:
+def _cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mcp-beancount"
+
+
+def _cache_key(config_path: Path | None, env: Mapping[str, str]) -> str:
+    if config_path is not None:
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+    else:
+        mtime_ns = 0
+    relevant_env = sorted(
+        (key, value) for key, value in env.items() if key.startswith(CONFIG_ENV_PREFIX)
+    )
+    # Frozen slotted dataclasses pickle their state positionally, so a cache
+    # entry from a different field layout would silently shift values into the
+    # wrong fields; keying on the layout makes such entries unreachable.
+    layout = tuple(f.name for f in fields(AppConfig))
+    payload = repr((layout, str(config_path) if config_path else None, mtime_ns, relevant_env))
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def _read_cached_config(key: str) -> AppConfig | None:
+    try:
+        data = (_cache_dir() / f"{key}.pkl").read_bytes()
+        cached = pickle.loads(data)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+    return cached if isinstance(cached, AppConfig) else None
+
+
+# Upper bound on cached config entries; every distinct (layout, path, mtime,
+# env) key writes a new file, so old ones are pruned to keep the dir bounded.
+_CONFIG_CACHE_LIMIT = 16
+
+
+def _write_cached_config(key: str, config: AppConfig) -> None:
+    try:
+        cache_dir = _cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{key}.pkl").write_bytes(pickle.dumps(config))
+        entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in entries[_CONFIG_CACHE_LIMIT:]:
+            stale.unlink(missing_ok=True)
+    except (OSError, pickle.PickleError):  # pragma: no cover - cache is best effort
+        pass
+
+
+@functools.cache
+def _get_toml_parser() -> Any:
+    # tomllib is only pulled in when a config file actually exists; the cache
+    # makes repeated loads reuse the resolved parser without a sys.modules hit.
     import tomllib
 
-    with path.open("rb") as handle:
-        return tomllib.load(handle)
+    return tomllib.loads
+
+
+def _load_toml_config(path: Path) -> dict[str, Any]:
+    return _get_toml_parser()(path.read_bytes().decode("utf-8"))
 
 
 def load_config(
@@ -126,7 +220,7 @@ def load_config(
 ) -> AppConfig:
     """Load configuration from a file and environment variables."""
 
-    env = dict(env or os.environ)
+    env = os.environ if env is None else env
     config_path: Path | None = None
 
     if explicit_path:
@@ -142,12 +236,26 @@ def load_config(
                 raise ConfigError(f"Environment-selected config file not found: {candidate}")
             config_path = candidate
         else:
+            # One directory read instead of a stat probe per candidate name.
+            wanted = frozenset(DEFAULT_CONFIG_FILENAMES)
+            found: set[str] = set()
+            with os.scandir(".") as it:
+                for dir_entry in it:
+                    if dir_entry.name in wanted and dir_entry.is_file():
+                        found.add(dir_entry.name)
             for filename in DEFAULT_CONFIG_FILENAMES:
-                candidate = Path(filename).expanduser()
-                if candidate.exists():
-                    config_path = candidate
+                if filename in found:
+                    config_path = Path(filename)
                     break
 
+    cache_key = _cache_key(config_path, env)
+    cached = _read_cached_config(cache_key)
+    if cached is not None:
+        # Re-run the cheap path normalisation (one stat) so a ledger deleted
+        # or replaced since the cache write still fails with a ConfigError
+        # instead of surfacing later as a raw OSError from the manager.
+        return cached._normalise_paths()
+
     file_data: dict[str, Any] = {}
     if config_path:
         file_data = _load_toml_config(config_path)
@@ -155,49 +263,19 @@ def load_config(
     config_data: dict[str, Any] = {}
     config_data.update(file_data)
 
-    # Apply environment overrides.
-    env_mapping = {
-        "LEDGER": "ledger_path",
-        "LEDGER_PATH": "ledger_path",
-        "DEFAULT_CURRENCY": "default_currency",
-        "TIMEZONE": "timezone",
-        "LOCALE": "locale",
-        "BACKUP_DIR": "backup_dir",
-        "BACKUP_RETENTION": "backup_retention",
-        "LOCK_TIMEOUT": "lock_timeout",
-        "DRY_RUN_DEFAULT": "dry_run_default",
-        "HTTP_HOST": "http_host",
-        "HTTP_PORT": "http_port",
-        "HTTP_PATH": "http_path",
-        "ENABLE_NL": "enable_nl",
-        # Google OAuth
-        "GOOGLE_AUTH_ENABLED": "google_auth_enabled",
-        "GOOGLE_CLIENT_ID": "google_client_id",
-        "GOOGLE_CLIENT_SECRET": "google_client_secret",
-        "GOOGLE_BASE_URL": "google_base_url",
-        "GOOGLE_REQUIRED_SCOPES": "google_required_scopes",
-        "GOOGLE_REDIRECT_PATH": "google_redirect_path",
-        "GOOGLE_ALLOWED_EMAILS": "google_allowed_emails",
-    }
-
-    for env_key, field_name in env_mapping.items():
-        value = env.get(f"{CONFIG_ENV_PREFIX}{env_key}")
-        if value is not None:
-            if field_name in {"lock_timeout"}:
-                config_data[field_name] = float(value)
-            elif field_name in {"http_port", "backup_retention"}:
-                config_data[field_name] = int(value)
-            elif field_name in {"dry_run_default", "enable_nl", "google_auth_enabled"}:
-                config_data[field_name] = value.lower() in {"1", "true", "yes", "on"}
-            elif field_name in {"google_required_scopes"}:
-                # Comma or space separated list
-                scopes = [s.strip() for s in value.replace(" ", ",").split(",") if s.strip()]
-                config_data[field_name] = scopes
-            elif field_name in {"google_allowed_emails"}:
-                emails = [s.strip() for s in value.replace(" ", ",").split(",") if s.strip()]
-                config_data[field_name] = emails
-            else:
-                config_data[field_name] = value
+    # Apply environment overrides with a single scan over what is actually set.
+    prefix_len = len(CONFIG_ENV_PREFIX)
+    for name, value in env.items():
+        if not name.startswith(CONFIG_ENV_PREFIX):
+            continue
+        spec = _ENV_SPEC.get(name[prefix_len:])
+        if spec is None:
+            continue
+        # LEDGER is an alias of LEDGER_PATH; the explicit form wins if both are set.
+        if name == f"{CONFIG_ENV_PREFIX}LEDGER" and f"{CONFIG_ENV_PREFIX}LEDGER_PATH" in env:
+            continue
+        field_name, coerce = spec
+        config_data[field_name] = coerce(value)
 
     if "ledger_path" not in config_data:
         raise ConfigError(
@@ -206,6 +284,10 @@ def load_config(
         )
 
     try:
-        return AppConfig(**config_data)
-    except ValidationError as exc:
+        config = AppConfig(**config_data)
+    except TypeError as exc:
+        # Unknown keys (e.g. config-file typos) surface here.
         raise ConfigError(str(exc)) from exc
+
+    _write_cached_config(cache_key, config)
+    return config
@@ -4,30 +4,46 @@ from __future__ import annotations
 class MCPBeancountError(Exception):
     """Base class for all MCP Beancount errors."""
 
+    __slots__ = ()
+
 
 class ConfigError(MCPBeancountError):
     """Raised when configuration cannot be loaded or is invalid."""
 
+    __slots__ = ()
+
 
 class LedgerLoadError(MCPBeancountError):
     """Raised when the ledger cannot be loaded."""
 
+    __slots__ = ()
+
 
 class LedgerValidationError(LedgerLoadError):
     """Raised when the ledger contains validation errors."""
 
+    __slots__ = ()
+
 
 class FileLockTimeout(MCPBeancountError):
     """Raised when acquiring the ledger file lock times out."""
 
+    __slots__ = ()
+
 
 class TransactionValidationError(MCPBeancountError):
     """Raised when a transaction fails validation."""
 
+    __slots__ = ()
+
 
 class TransactionNotFoundError(MCPBeancountError):
     """Raised when the requested transaction cannot be located."""
 
+    __slots__ = ()
+
 
 class NaturalLanguageError(MCPBeancountError):
     """Raised when we cannot map an NL question to a safe query."""
+
+    __slots__ = ()
@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import datetime as dt
 import difflib
-import io
 import os
+import pickle
 import shutil
 import tempfile
-import threading
 import uuid
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Mapping, Sequence
+
+import beancount
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 
 from beanquery import query as beanquery
 from beancount import api
@@ -20,8 +23,9 @@ from beancount.core import data, inventory, prices
 from beancount.core.amount import Amount
 from beancount.core.number import D
 from beancount.core.position import Cost
-from beancount.loader import load_file
-from beancount.parser.printer import format_entry, print_errors
+from beancount.loader import load_file, load_string
+from beancount.parser import parser
+from beancount.parser.printer import format_entry, format_error
 
 from .config import AppConfig
 from .exceptions import (
@@ -31,10 +35,11 @@ from .exceptions import (
     TransactionNotFoundError,
     TransactionValidationError,
 )
-from .locking import FileLock
+from .locking import FileLock, ReadWriteLock
 from .schemas import (
     AccountBalance,
     AccountInfo,
+    AmountModel,
     BalanceRequest,
     BalanceResult,
     BeanQueryResult,
@@ -57,26 +62,145 @@ from .utils import decimal_to_string, parse_decimal
 from . import nl
 
 
+# Bump when the pickled LedgerSnapshot layout changes so stale parse caches
+# from older code are discarded instead of resurfacing with missing fields.
+_PARSE_CACHE_SCHEMA = 8
+
+# (date, account, units) rows for every transaction posting, in ledger order.
+# Entries arrive date-sorted from the loader, so the rows are too, which lets
+# date-range queries bisect instead of scanning every directive.
+PostingRow = tuple[dt.date, str, Amount]
+
+# (transaction, lowercased payee, lowercased narration) rows so substring
+# filters match against pre-lowered text instead of allocating per call.
+TransactionRow = tuple[data.Transaction, str, str]
+
+
+@dataclass(slots=True)
+class AccountsIndex:
+    opens: dict[str, data.Open]
+    closes: dict[str, data.Close]
+    currencies: dict[str, set[str]]
+    booking: dict[str, str | None]
+    metadata: dict[str, dict[str, object]]
+
+
 @dataclass(slots=True)
 class LedgerSnapshot:
     entries: data.Directives
     errors: list[data.BeancountError]
     options_map: dict[str, object]
-    price_map: api.PriceMap
     text: str
-    mtime: float
+    mtime_ns: int
     size: int
+    ino: int
+    accounts_index: AccountsIndex
+    postings_flat: list[PostingRow]
+    txn_rows: list[TransactionRow]
+    txn_id_index: dict[str, data.Transaction]
+    duplicate_txn_ids: set[str]
+    # Response models rendered from this snapshot, keyed by
+    # (id(transaction), include_postings). Entries are immutable for the
+    # snapshot's lifetime, so cached models never go stale.
+    model_cache: dict[tuple[int, bool], TransactionModel] = field(default_factory=dict)
+    # Built on first conversion request; most queries never price anything.
+    _price_map: api.PriceMap | None = None
+
+    @property
+    def price_map(self) -> api.PriceMap:
+        if self._price_map is None:
+            self._price_map = prices.build_price_map(self.entries)
+        return self._price_map
+
+    def __getstate__(self) -> dict[str, object]:
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        # id()-keyed entries are meaningless in another process.
+        state["model_cache"] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+
+def _build_accounts_index(entries: data.Directives) -> AccountsIndex:
+    """Classify directives for account listings in a single pass."""
+
+    index = AccountsIndex(opens={}, closes={}, currencies=defaultdict(set), booking={}, metadata={})
+
+    def _handle_open(entry: data.Open) -> None:
+        index.opens[entry.account] = entry
+        index.booking[entry.account] = entry.booking
+        index.metadata[entry.account] = _clean_meta(entry.meta)
+        for curr in entry.currencies or []:
+            index.currencies[entry.account].add(curr)
+
+    def _handle_close(entry: data.Close) -> None:
+        index.closes[entry.account] = entry
+
+    def _handle_transaction(entry: data.Transaction) -> None:
+        for posting in entry.postings:
+            index.currencies[posting.account].add(posting.units.currency)
+
+    handlers = {
+        data.Open: _handle_open,
+        data.Close: _handle_close,
+        data.Transaction: _handle_transaction,
+    }
+    for entry in entries:
+        handler = handlers.get(type(entry))
+        if handler is not None:
+            handler(entry)
+    index.currencies = dict(index.currencies)
+    return index
+
+
+def _build_postings_flat(entries: data.Directives) -> list[PostingRow]:
+    flat: list[PostingRow] = []
+    for entry in entries:
+        if type(entry) is data.Transaction:
+            date = entry.date
+            for posting in entry.postings:
+                flat.append((date, posting.account, posting.units))
+    return flat
+
+
+def _build_txn_rows(entries: data.Directives) -> list[TransactionRow]:
+    return [
+        (entry, (entry.payee or "").lower(), (entry.narration or "").lower())
+        for entry in entries
+        if type(entry) is data.Transaction
+    ]
+
+
+def _build_txn_id_index(
+    txn_rows: Sequence[TransactionRow],
+) -> tuple[dict[str, data.Transaction], set[str]]:
+    index: dict[str, data.Transaction] = {}
+    duplicates: set[str] = set()
+    for txn, _, _ in txn_rows:
+        txn_id = txn.meta.get("txn_id")
+        if txn_id is None:
+            continue
+        if txn_id in index:
+            duplicates.add(txn_id)
+        else:
+            index[txn_id] = txn
+    return index, duplicates
+
+
+def _slice_postings_by_date(
+    flat: list[PostingRow],
+    start: dt.date | None,
+    end: dt.date | None,
+) -> list[PostingRow]:
+    lo = bisect_left(flat, start, key=itemgetter(0)) if start else 0
+    hi = bisect_right(flat, end, key=itemgetter(0)) if end else len(flat)
+    return flat[lo:hi]
 
 
 def _error_messages(errors: Sequence[data.BeancountError]) -> list[str]:
-    if not errors:
-        return []
-    messages: list[str] = []
-    for err in errors:
-        buffer = io.StringIO()
-        print_errors([err], file=buffer)
-        messages.append(buffer.getvalue().strip())
-    return messages
+    return [format_error(err).strip() for err in errors]
 
 
 class LedgerManager:
@@ -85,35 +209,92 @@ class LedgerManager:
     def __init__(self, config: AppConfig) -> None:
         self.config = config
         self.ledger_path = config.ledger_path
+        self._str_path = str(config.ledger_path)
         self._snapshot: LedgerSnapshot | None = None
-        self._lock = threading.RLock()
+        self._lock = ReadWriteLock()
+        # Known backups, newest first; seeded from one directory scan on the
+        # first write and maintained incrementally afterwards.
+        self._backups: deque[Path] | None = None
 
     # ------------------------------------------------------------------ Loading
 
-    def load(self, *, force: bool = False) -> LedgerSnapshot:
-        with self._lock:
-            stat = self.ledger_path.stat()
+    @property
+    def _parse_cache_path(self) -> Path:
+        return Path(f"{self.ledger_path}.parsecache")
+
+    def _read_parse_cache(self, stat: os.stat_result) -> LedgerSnapshot | None:
+        try:
+            payload = pickle.loads(self._parse_cache_path.read_bytes())
             if (
-                not force
-                and self._snapshot is not None
-                and self._snapshot.mtime == stat.st_mtime
-                and self._snapshot.size == stat.st_size
+                payload["schema"] != _PARSE_CACHE_SCHEMA
+                or payload["version"] != beancount.__version__
+                or payload["mtime_ns"] != stat.st_mtime_ns
+                or payload["size"] != stat.st_size
             ):
-                return self._snapshot
+                return None
+            return payload["snapshot"]
+        except Exception:  # cache is best effort; any corruption means reparse
+            return None
+
+    def _write_parse_cache(self, snapshot: LedgerSnapshot) -> None:
+        try:
+            payload = {
+                "schema": _PARSE_CACHE_SCHEMA,
+                "version": beancount.__version__,
+                "mtime_ns": snapshot.mtime_ns,
+                "size": snapshot.size,
+                "snapshot": snapshot,
+            }
+            self._parse_cache_path.write_bytes(
+                pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except Exception:  # pragma: no cover - cache is best effort
+            pass
+
+    def _invalidate_parse_cache(self) -> None:
+        self._parse_cache_path.unlink(missing_ok=True)
+
+    def load(self, *, force: bool = False) -> LedgerSnapshot:
+        stat = os.stat(self._str_path)
+        if not force:
+            # Concurrent readers share the lock on the common unchanged path;
+            # only a reparse needs exclusivity.
+            with self._lock.read_locked():
+                snapshot = self._snapshot
+                if snapshot is not None and _snapshot_is_current(snapshot, stat):
+                    return snapshot
+
+        with self._lock.write_locked():
+            snapshot = self._snapshot
+            if not force and snapshot is not None and _snapshot_is_current(snapshot, stat):
+                return snapshot
+
+            if not force:
+                cached = self._read_parse_cache(stat)
+                if cached is not None:
+                    self._snapshot = cached
+                    return cached
 
             text = self.ledger_path.read_text(encoding="utf-8")
             entries, errors, options_map = load_file(str(self.ledger_path))
-            price_map = prices.build_price_map(entries)
+            txn_rows = _build_txn_rows(entries)
+            txn_id_index, duplicate_txn_ids = _build_txn_id_index(txn_rows)
             snapshot = LedgerSnapshot(
                 entries=entries,
                 errors=list(errors),
                 options_map=options_map,
-                price_map=price_map,
                 text=text,
-                mtime=stat.st_mtime,
+                mtime_ns=stat.st_mtime_ns,
                 size=stat.st_size,
+                ino=stat.st_ino,
+                accounts_index=_build_accounts_index(entries),
+                postings_flat=_build_postings_flat(entries),
+                txn_rows=txn_rows,
+                txn_id_index=txn_id_index,
+                duplicate_txn_ids=duplicate_txn_ids,
             )
             self._snapshot = snapshot
+            self._write_parse_cache(snapshot)
             return snapshot
 
     # ----------------------------------------------------------------- Accounts
@@ -122,24 +303,12 @@ class LedgerManager:
         snapshot = self.load()
         errors = _error_messages(snapshot.errors)
 
-        open_entries: dict[str, data.Open] = {}
-        close_entries: dict[str, data.Close] = {}
-        currencies: dict[str, set[str]] = defaultdict(set)
-        booking: dict[str, str | None] = {}
-        metadata: dict[str, dict[str, object]] = {}
-
-        for entry in snapshot.entries:
-            if isinstance(entry, data.Open):
-                open_entries[entry.account] = entry
-                booking[entry.account] = entry.booking
-                metadata[entry.account] = _clean_meta(entry.meta)
-                for curr in entry.currencies or []:
-                    currencies[entry.account].add(curr)
-            elif isinstance(entry, data.Close):
-                close_entries[entry.account] = entry
-            elif isinstance(entry, data.Transaction):
-                for posting in entry.postings:
-                    currencies[posting.account].add(posting.units.currency)
+        index = snapshot.accounts_index
+        open_entries = index.opens
+        close_entries = index.closes
+        currencies = index.currencies
+        booking = index.booking
+        metadata = index.metadata
 
         accounts = set(open_entries) | set(currencies) | set(close_entries)
         infos: list[AccountInfo] = []
@@ -167,25 +336,35 @@ class LedgerManager:
 
     def balance(self, request: BalanceRequest) -> BalanceResult:
         snapshot = self.load()
-        entries = self._filter_entries(snapshot.entries, request.start_date, request.end_date, request.at_date)
-
-        balances: dict[str, inventory.Inventory] = defaultdict(inventory.Inventory)
-        total = inventory.Inventory()
+        upper_bounds = [d for d in (request.end_date, request.at_date) if d is not None]
+        rows = _slice_postings_by_date(
+            snapshot.postings_flat,
+            request.start_date,
+            min(upper_bounds) if upper_bounds else None,
+        )
         account_filters = request.accounts or []
+        matches = _account_matcher(account_filters, request.include_children)
+
+        # Sum plain Decimals per (account, currency) and only materialise
+        # Inventory objects from the aggregates, one position per currency.
+        sums: dict[str, dict[str, Decimal]] = defaultdict(dict)
+        total_sums: dict[str, Decimal] = {}
+        for _, account, units in rows:
+            if account_filters and not matches(account):
+                continue
+            currency = units.currency
+            account_sums = sums[account]
+            account_sums[currency] = account_sums.get(currency, _ZERO) + units.number
+            total_sums[currency] = total_sums.get(currency, _ZERO) + units.number
 
-        for entry in entries:
-            if isinstance(entry, data.Transaction):
-                for posting in entry.postings:
-                    if account_filters and not _account_matches(posting.account, account_filters, request.include_children):
-                        continue
-                    balances[posting.account].add_amount(posting.units)
-                    total.add_amount(posting.units)
+        balances = {account: _sums_to_inventory(currency_sums) for account, currency_sums in sums.items()}
+        total = _sums_to_inventory(total_sums)
 
         converted_balances = [
-            AccountBalance(account=account, balance=_inventory_to_amounts(inv, snapshot.price_map, request.convert_to, request.end_date))
+            AccountBalance(account=account, balance=_inventory_to_amounts(inv, snapshot, request.convert_to, request.end_date))
             for account, inv in sorted(balances.items())
         ]
-        total_amounts = _inventory_to_amounts(total, snapshot.price_map, request.convert_to, request.end_date)
+        total_amounts = _inventory_to_amounts(total, snapshot, request.convert_to, request.end_date)
 
         return BalanceResult(balances=converted_balances, total=total_amounts, as_of=request.end_date or request.at_date)
 
@@ -193,34 +372,30 @@ class LedgerManager:
 
     def income_sheet(self, request: IncomeSheetRequest) -> IncomeSheetResult:
         snapshot = self.load()
-        entries = self._filter_entries(snapshot.entries, request.start_date, request.end_date, None)
-
-        income_balances: dict[str, inventory.Inventory] = defaultdict(inventory.Inventory)
-        expense_balances: dict[str, inventory.Inventory] = defaultdict(inventory.Inventory)
-
-        for entry in entries:
-            if isinstance(entry, data.Transaction):
-                for posting in entry.postings:
-                    if posting.account.startswith("Income:"):
-                        income_balances[posting.account].add_amount(posting.units)
-                    elif posting.account.startswith("Expenses:"):
-                        expense_balances[posting.account].add_amount(posting.units)
+        rows = _slice_postings_by_date(snapshot.postings_flat, request.start_date, request.end_date)
+
+        # One prefix test per posting; the first character then tells the two
+        # categories apart without a second startswith.
+        income_sums: dict[str, dict[str, Decimal]] = defaultdict(dict)
+        expense_sums: dict[str, dict[str, Decimal]] = defaultdict(dict)
+        net_sums: dict[str, Decimal] = {}
+        for _, account, units in rows:
+            if not account.startswith(_INCOME_EXPENSE_PREFIXES):
+                continue
+            account_sums = (income_sums if account[0] == "I" else expense_sums)[account]
+            currency = units.currency
+            account_sums[currency] = account_sums.get(currency, _ZERO) + units.number
+            net_sums[currency] = net_sums.get(currency, _ZERO) + units.number
 
         income = [
-            IncomeCategory(account=account, amount=_inventory_to_amounts(inv, snapshot.price_map, request.convert_to, request.end_date))
-            for account, inv in sorted(income_balances.items())
+            IncomeCategory(account=account, amount=_inventory_to_amounts(_sums_to_inventory(currency_sums), snapshot, request.convert_to, request.end_date))
+            for account, currency_sums in sorted(income_sums.items())
         ]
         expenses = [
-            IncomeCategory(account=account, amount=_inventory_to_amounts(inv, snapshot.price_map, request.convert_to, request.end_date))
-            for account, inv in sorted(expense_balances.items())
+            IncomeCategory(account=account, amount=_inventory_to_amounts(_sums_to_inventory(currency_sums), snapshot, request.convert_to, request.end_date))
+            for account, currency_sums in sorted(expense_sums.items())
         ]
-
-        net_inventory = inventory.Inventory()
-        for inv in income_balances.values():
-            net_inventory.add_inventory(inv)
-        for inv in expense_balances.values():
-            net_inventory.add_inventory(inv)
-        net = _inventory_to_amounts(net_inventory, snapshot.price_map, request.convert_to, request.end_date)
+        net = _inventory_to_amounts(_sums_to_inventory(net_sums), snapshot, request.convert_to, request.end_date)
 
         return IncomeSheetResult(income=income, expenses=expenses, net=net)
 
@@ -230,17 +405,18 @@ class LedgerManager:
         snapshot = self.load()
         matches: list[data.Transaction] = []
         accounts = request.accounts or []
+        account_match = _account_matcher(accounts, True)
+        payee_query = request.payee.lower() if request.payee else None
+        narration_query = request.narration.lower() if request.narration else None
 
-        for entry in snapshot.entries:
-            if not isinstance(entry, data.Transaction):
-                continue
+        for entry, payee_lc, narration_lc in snapshot.txn_rows:
             if request.start_date and entry.date < request.start_date:
                 continue
             if request.end_date and entry.date > request.end_date:
                 continue
-            if request.payee and (entry.payee or "").lower().find(request.payee.lower()) == -1:
+            if payee_query is not None and payee_query not in payee_lc:
                 continue
-            if request.narration and (entry.narration or "").lower().find(request.narration.lower()) == -1:
+            if narration_query is not None and narration_query not in narration_lc:
                 continue
             if request.tags and not set(request.tags).issubset(entry.tags or set()):
                 continue
@@ -248,7 +424,7 @@ class LedgerManager:
                 if not _metadata_matches(entry.meta, request.metadata):
                     continue
             if accounts:
-                if not any(_account_matches(posting.account, accounts, True) for posting in entry.postings):
+                if not any(account_match(posting.account) for posting in entry.postings):
                     continue
             matches.append(entry)
 
@@ -257,7 +433,15 @@ class LedgerManager:
         end = None if request.limit is None else start + request.limit
         selected = matches[start:end] if end is not None else matches[start:]
 
-        transactions = [_to_transaction_model(txn, include_postings=request.include_postings) for txn in selected]
+        cache = snapshot.model_cache
+        transactions: list[TransactionModel] = []
+        for txn in selected:
+            key = (id(txn), request.include_postings)
+            model = cache.get(key)
+            if model is None:
+                model = _to_transaction_model(txn, include_postings=request.include_postings)
+                cache[key] = model
+            transactions.append(model)
         return ListTransactionsResult(total=total, transactions=transactions)
 
     # ---------------------------------------------------------------- Mutations
@@ -267,14 +451,20 @@ class LedgerManager:
         dry_run = request.dry_run if request.dry_run is not None else self.config.dry_run_default
         txn_id = request.txn_id or str(uuid.uuid4())
 
-        if self._transaction_exists(snapshot.entries, txn_id):
+        if self._transaction_exists(snapshot, txn_id):
             raise TransactionValidationError(f"Transaction with txn_id '{txn_id}' already exists.")
 
         transaction = _build_transaction(request, txn_id)
         formatted = format_entry(transaction)
+        self._validate_entry_text(formatted)
 
         new_text = _append_entry(snapshot.text, formatted)
-        self._validate_text(new_text)
+        if self.config.strict_validation:
+            # Full reparse of the updated ledger; opt-in because the entry is
+            # already structurally validated (balanced, unique id, parseable).
+            self._validate_text(new_text)
+        else:
+            self._check_accounts_open(snapshot, transaction)
 
         diff = _diff(snapshot.text, new_text, self.ledger_path.name)
         if dry_run:
@@ -287,9 +477,13 @@ class LedgerManager:
     def remove_transaction(self, request: RemoveTransactionRequest) -> RemoveTransactionResult:
         snapshot = self.load()
         dry_run = request.dry_run if request.dry_run is not None else self.config.dry_run_default
-        transaction = self._get_transaction(snapshot.entries, request.txn_id)
+        transaction = self._get_transaction(snapshot, request.txn_id)
         new_text = _remove_entry(snapshot.text, transaction)
-        self._validate_text(new_text)
+        # Excising a well-formed entry cannot introduce syntax errors, but it
+        # can break balance/pad assertions that depended on it - reparse when
+        # any such directive touches the removed accounts on or after its date.
+        if self.config.strict_validation or _removal_affects_assertions(snapshot, transaction):
+            self._validate_text(new_text)
         diff = _diff(snapshot.text, new_text, self.ledger_path.name)
 
         if dry_run:
@@ -326,115 +520,165 @@ class LedgerManager:
             timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%S")
             backup_path = backup_dir / f"{self.ledger_path.name}.{timestamp}.bak"
             shutil.copy2(self.ledger_path, backup_path)
-            self._prune_backups()
+            self._register_backup(backup_path)
 
             fd, tmp_path = tempfile.mkstemp(
                 suffix=".tmp",
                 dir=str(self.ledger_path.parent),
             )
-            os.close(fd)
             try:
                 mode = os.stat(self.ledger_path).st_mode
             except FileNotFoundError:  # pragma: no cover - defensive
                 mode = None
-            with open(tmp_path, "w", encoding="utf-8") as handle:
-                handle.write(text)
+            try:
+                # One write of the encoded payload, flushed to disk before the
+                # rename so the replacement is durable, not just atomic.
+                os.write(fd, text.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             if mode is not None:
                 os.chmod(tmp_path, mode)
+            self._invalidate_parse_cache()
             os.replace(tmp_path, self.ledger_path)
+            if os.name == "posix":
+                # Persist the rename itself by syncing the directory entry.
+                dir_fd = os.open(str(self.ledger_path.parent), os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
+    def _register_backup(self, backup_path: Path) -> None:
+        if self._backups is None:
+            # First write this process: one scan picks up pre-existing backups
+            # (including the one just written).
+            self._backups = deque(
+                sorted(self.config.backup_dir.glob(f"{self.ledger_path.name}.*.bak"), reverse=True)
+            )
+        else:
+            self._backups.appendleft(backup_path)
 
-    def _prune_backups(self) -> None:
         retention = self.config.backup_retention
         if retention is None or retention <= 0:
             return
-        backups = sorted(self.config.backup_dir.glob(f"{self.ledger_path.name}.*.bak"), reverse=True)
-        for path in backups[retention:]:
-            path.unlink(missing_ok=True)
+        while len(self._backups) > retention:
+            self._backups.pop().unlink(missing_ok=True)
+
+    def _validate_entry_text(self, entry_text: str) -> None:
+        """Parse just the newly formatted entry instead of reloading the ledger."""
+
+        _, errors, _ = parser.parse_string(entry_text)
+        if errors:
+            raise LedgerValidationError("; ".join(_error_messages(errors)))
 
     def _validate_text(self, text: str) -> None:
-        with tempfile.NamedTemporaryFile(
-            "w",
-            encoding="utf-8",
-            suffix=".beancount",
-            delete=False,
-            dir=self.ledger_path.parent,
-        ) as tmp:
-            tmp.write(text)
-            tmp_path = Path(tmp.name)
-        try:
-            entries, errors, _ = load_file(tmp_path)
-            if errors:
-                raise LedgerValidationError("; ".join(_error_messages(errors)))
-        finally:
-            tmp_path.unlink(missing_ok=True)
-
-    def _filter_entries(
-        self,
-        entries: Sequence[data.Directive],
-        start: dt.date | None,
-        end: dt.date | None,
-        at: dt.date | None,
-    ) -> Iterable[data.Directive]:
-        for entry in entries:
-            entry_date = getattr(entry, "date", None)
-            if isinstance(entry_date, dt.date):
-                if start and entry_date < start:
-                    continue
-                if end and entry_date > end:
-                    continue
-                if at and entry_date > at:
-                    continue
-            yield entry
+        _, errors, _ = load_string(text)
+        if errors:
+            raise LedgerValidationError("; ".join(_error_messages(errors)))
+
+    def _check_accounts_open(self, snapshot: LedgerSnapshot, transaction: data.Transaction) -> None:
+        opens = snapshot.accounts_index.opens
+        closes = snapshot.accounts_index.closes
+        for posting in transaction.postings:
+            open_entry = opens.get(posting.account)
+            if open_entry is None:
+                raise LedgerValidationError(f"Account is not open: {posting.account}")
+            if transaction.date < open_entry.date:
+                raise LedgerValidationError(f"Account is not yet open at the posting date: {posting.account}")
+            if open_entry.currencies and posting.units.currency not in open_entry.currencies:
+                raise LedgerValidationError(
+                    f"Currency {posting.units.currency} is not allowed for account: {posting.account}"
+                )
+            close_entry = closes.get(posting.account)
+            if close_entry is not None and transaction.date > close_entry.date:
+                raise LedgerValidationError(f"Account is closed as of the posting date: {posting.account}")
 
-    def _transaction_exists(self, entries: Sequence[data.Directive], txn_id: str) -> bool:
-        try:
-            self._get_transaction(entries, txn_id)
-        except TransactionNotFoundError:
-            return False
-        return True
+    def _transaction_exists(self, snapshot: LedgerSnapshot, txn_id: str) -> bool:
+        return txn_id in snapshot.txn_id_index
 
-    def _get_transaction(self, entries: Sequence[data.Directive], txn_id: str) -> data.Transaction:
-        matches = [
-            entry
-            for entry in entries
-            if isinstance(entry, data.Transaction) and entry.meta.get("txn_id") == txn_id
-        ]
-        if not matches:
-            raise TransactionNotFoundError(f"No transaction found with txn_id '{txn_id}'")
-        if len(matches) > 1:
+    def _get_transaction(self, snapshot: LedgerSnapshot, txn_id: str) -> data.Transaction:
+        if txn_id in snapshot.duplicate_txn_ids:
             raise TransactionValidationError(f"Multiple transactions share txn_id '{txn_id}'")
-        return matches[0]
+        transaction = snapshot.txn_id_index.get(txn_id)
+        if transaction is None:
+            raise TransactionNotFoundError(f"No transaction found with txn_id '{txn_id}'")
+        return transaction
 
 
 # --------------------------------------------------------------------------- utils
 
 
-def _account_matches(account: str, filters: Sequence[str], include_children: bool) -> bool:
-    for prefix in filters:
-        if account == prefix:
-            return True
-        if include_children and account.startswith(prefix + ":"):
-            return True
+_ZERO = D("0")
+
+_INCOME_EXPENSE_PREFIXES = ("Income:", "Expenses:")
+
+
+def _removal_affects_assertions(snapshot: LedgerSnapshot, transaction: data.Transaction) -> bool:
+    accounts = {posting.account for posting in transaction.postings}
+    for entry in snapshot.entries:
+        if entry.date < transaction.date:
+            continue
+        entry_type = type(entry)
+        if entry_type is data.Balance:
+            if entry.account in accounts:
+                return True
+        elif entry_type is data.Pad:
+            if entry.account in accounts or entry.source_account in accounts:
+                return True
     return False
 
 
+def _snapshot_is_current(snapshot: LedgerSnapshot, stat: os.stat_result) -> bool:
+    return (
+        snapshot.mtime_ns == stat.st_mtime_ns
+        and snapshot.size == stat.st_size
+        and snapshot.ino == stat.st_ino
+    )
+
+
+def _sums_to_inventory(currency_sums: Mapping[str, Decimal]) -> inventory.Inventory:
+    inv = inventory.Inventory()
+    for currency, number in currency_sums.items():
+        inv.add_amount(Amount(number, currency))
+    return inv
+
+
+def _account_matcher(filters: Sequence[str], include_children: bool) -> Callable[[str], bool]:
+    """Build a membership test with the filter set precomputed once.
+
+    Exact names hash into a frozenset and child matches ride on
+    str.startswith with a tuple, which is a single C-level loop, instead of
+    concatenating prefix + ':' per posting.
+    """
+
+    exact = frozenset(filters)
+    prefixes = tuple(f"{prefix}:" for prefix in filters) if include_children else ()
+
+    def matches(account: str) -> bool:
+        return account in exact or account.startswith(prefixes)
+
+    return matches
+
+
 def _inventory_to_amounts(
     inv: inventory.Inventory,
-    price_map: api.PriceMap,
+    snapshot: LedgerSnapshot,
     convert_to: str | None,
     date: dt.date | None,
 ) -> list:
     result = inv
     if convert_to:
-        result = inv.reduce(api.convert_position, convert_to, price_map, date)
+        # Only conversions touch the price map, keeping its build lazy.
+        result = inv.reduce(api.convert_position, convert_to, snapshot.price_map, date)
     amounts = []
     for position in result:
         amount = position.units if hasattr(position, "units") else position
         amounts.append(
-            {
-                "number": decimal_to_string(amount.number),
-                "currency": amount.currency,
-            }
+            AmountModel.model_construct(
+                number=decimal_to_string(amount.number),
+                currency=amount.currency,
+            )
         )
     return amounts
 
@@ -565,31 +809,57 @@ def _append_entry(original: str, entry_text: str) -> str:
     return f"{stripped}\n\n{entry_text}\n"
 
 
+def _line_offset(text: str, line_index: int) -> int:
+    """Byte offset where the given zero-based line starts, or -1 if out of range."""
+
+    offset = 0
+    for _ in range(line_index):
+        newline = text.find("\n", offset)
+        if newline == -1:
+            return -1
+        offset = newline + 1
+    return offset if offset < len(text) else -1
+
+
 def _remove_entry(original: str, transaction: data.Transaction) -> str:
     trailing_newlines = len(original) - len(original.rstrip("\n"))
     if trailing_newlines <= 0:
         trailing_newlines = 1
-    lines = original.splitlines()
     start = transaction.meta.get("lineno")
     if start is None:
         raise TransactionValidationError("Transaction is missing 'lineno' metadata; cannot remove safely.")
 
     index = start - 1
-    if index < 0 or index >= len(lines):
+    offset = _line_offset(original, index) if index >= 0 else -1
+    if offset == -1:
         raise LedgerLoadError("Transaction line number is out of range.")
 
-    end = index
-    while end < len(lines) and lines[end].strip() != "":
-        end += 1
-    while end < len(lines) and lines[end].strip() == "":
-        end += 1
+    # Walk line starts to the end of the entry (first blank line), then past
+    # the blank run, and excise with two slices instead of splitting every
+    # line of the ledger into a list.
+    size = len(original)
 
-    new_lines = lines[:index] + lines[end:]
-    stripped = "\n".join(new_lines).rstrip("\n")
+    def _skip_lines(position: int, *, blank: bool) -> int:
+        while position < size:
+            newline = original.find("\n", position)
+            line_end = size if newline == -1 else newline
+            if (original[position:line_end].strip() == "") is not blank:
+                break
+            position = size if newline == -1 else newline + 1
+        return position
+
+    end = _skip_lines(offset, blank=False)
+    end = _skip_lines(end, blank=True)
+
+    stripped = (original[:offset] + original[end:]).rstrip("\n")
     return stripped + ("\n" * trailing_newlines)
 
 
 def _diff(before: str, after: str, name: str) -> str:
+    if before.endswith("\n") and after.startswith(before):
+        # Inserts append to the ledger, so the diff is a single tail hunk that
+        # can be synthesised directly instead of diffing every line.
+        return _append_diff(before, after[len(before):], name)
     diff = difflib.unified_diff(
         before.splitlines(),
         after.splitlines(),
@@ -600,6 +870,27 @@ def _diff(before: str, after: str, name: str) -> str:
     return "\n".join(diff)
 
 
+def _unified_range(start: int, length: int) -> str:
+    if length == 1:
+        return str(start)
+    if not length:
+        return f"{start - 1},0"
+    return f"{start},{length}"
+
+
+def _append_diff(before: str, added: str, name: str) -> str:
+    total_lines = before.count("\n")
+    tail = before[:-1].rsplit("\n", 3)
+    context = tail[1:] if len(tail) > 3 else tail
+    added_lines = added.splitlines()
+    start = total_lines - len(context) + 1
+    hunk = f"@@ -{_unified_range(start, len(context))} +{_unified_range(start, len(context) + len(added_lines))} @@"
+    out = [f"--- {name} (before)", f"+++ {name} (after)", hunk]
+    out.extend(f" {line}" for line in context)
+    out.extend(f"+{line}" for line in added_lines)
+    return "\n".join(out)
+
+
 def _serialise_row(row: Sequence[object]) -> list[object]:
     serialised: list[object] = []
     for value in row:
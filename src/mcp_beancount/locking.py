@@ -1,14 +1,59 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import IO
+from typing import IO, Iterator
 
 from .exceptions import FileLockTimeout
 
 
+class ReadWriteLock:
+    """Writer-preferring read/write lock for in-process coordination.
+
+    Any number of readers may hold the lock concurrently; a writer waits for
+    readers to drain and blocks new ones while waiting, so reads cannot
+    starve a pending reparse.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer_active = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer_active or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer_active or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer_active = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_active = False
+                self._cond.notify_all()
+
+
 class FileLock(AbstractContextManager["FileLock"]):
     """Very small cross-platform file lock using advisory locking."""
 
@@ -22,21 +67,43 @@ class FileLock(AbstractContextManager["FileLock"]):
         start = time.monotonic()
         self.lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-        while True:
-            try:
-                handle = self.lock_path.open("a+")
-                _acquire(handle)
-                self._handle = handle
-                return
-            except BlockingIOError:
-                handle.close()
-            except OSError as exc:  # pragma: no cover - defensive
-                handle.close()
-                raise FileLockTimeout(f"Failed to acquire lock {self.lock_path}: {exc}") from exc
-
-            if time.monotonic() - start > self.timeout:
-                raise FileLockTimeout(f"Timed out waiting for lock {self.lock_path}")
-            time.sleep(self.poll_interval)
+        # The handle is opened once; only the flock call itself needs retrying.
+        # Exponential backoff: uncontended retries resolve within a couple of
+        # milliseconds while sustained contention settles at poll_interval.
+        handle = self.lock_path.open("a+")
+        delay = 0.001
+        try:
+            while True:
+                try:
+                    _acquire(handle)
+                except BlockingIOError:
+                    pass
+                except OSError as exc:  # pragma: no cover - defensive
+                    raise FileLockTimeout(f"Failed to acquire lock {self.lock_path}: {exc}") from exc
+                else:
+                    # release() unlinks the lockfile, so a waiter can win the
+                    # flock on an inode that is no longer the lockfile while a
+                    # newcomer locks the fresh one. Only a handle that still
+                    # names the on-disk path actually holds the lock.
+                    try:
+                        path_ino = os.stat(self.lock_path).st_ino
+                    except FileNotFoundError:
+                        path_ino = None
+                    if os.fstat(handle.fileno()).st_ino == path_ino:
+                        self._handle = handle
+                        return
+                    _release(handle)
+                    handle.close()
+                    handle = self.lock_path.open("a+")
+                    continue
+
+                if time.monotonic() - start > self.timeout:
+                    raise FileLockTimeout(f"Timed out waiting for lock {self.lock_path}")
+                time.sleep(delay)
+                delay = min(delay * 2, self.poll_interval)
+        except BaseException:
+            handle.close()
+            raise
 
     def release(self) -> None:
         if not self._handle:
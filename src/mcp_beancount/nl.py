@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import calendar
 import datetime as dt
+import functools
 import re
+import string
 from dataclasses import dataclass
 from typing import Callable
 
@@ -10,7 +12,8 @@ from .config import AppConfig
 from .exceptions import NaturalLanguageError
 
 
-_SAFE_ACCOUNT = re.compile(r"^[A-Z][A-Za-z0-9:-]*$")
+_ACCOUNT_CHARS = frozenset(string.ascii_letters + string.digits + ":-")
+
 
 
 def render_query(question: str, config: AppConfig) -> str:
@@ -20,10 +23,23 @@ def render_query(question: str, config: AppConfig) -> str:
         raise NaturalLanguageError("Question cannot be empty.")
 
     normalised = question.strip()
-    for template in _TEMPLATES:
-        match = template.pattern.match(normalised)
-        if match:
-            return template.builder(match, config)
+    # Lower once so the patterns stay case-sensitive and skip per-character
+    # casefolding; offsets into `normalised` recover case-preserving groups.
+    # (If lowering ever changes the length - exotic Unicode - fall back to the
+    # original text so the offsets stay valid.)
+    lowered = normalised.lower()
+    if len(lowered) != len(normalised):
+        lowered = normalised
+
+    # Each template is uniquely identified by its first two words, so one dict
+    # lookup picks the candidate and only its regex ever runs.
+    tokens = lowered.split(None, 2)
+    if len(tokens) >= 2:
+        template = _DISPATCH.get((tokens[0], tokens[1]))
+        if template is not None:
+            match = template.pattern.match(lowered)
+            if match:
+                return template.builder(match, normalised, config)
 
     raise NaturalLanguageError("Could not map question to a supported query template.")
 
@@ -31,17 +47,16 @@ def render_query(question: str, config: AppConfig) -> str:
 @dataclass(frozen=True)
 class _Template:
     pattern: re.Pattern[str]
-    builder: Callable[[re.Match[str], AppConfig], str]
+    builder: Callable[[re.Match[str], str, AppConfig], str]
 
 
-def _balance_builder(match: re.Match[str], _: AppConfig) -> str:
-    account = _sanitize_account(match.group("account"))
+def _balance_builder(match: re.Match[str], original: str, _: AppConfig) -> str:
+    account = _sanitize_account(original[slice(*match.span("account"))])
     date = match.group("date")
-    conditions = [f"account ~ '^{account}(:.*)?'"]
+    where_clause = f"account ~ '^{account}(:.*)?'"
     if date:
         _validate_date(date)
-        conditions.append(f"date <= date('{date}')")
-    where_clause = " AND ".join(conditions)
+        where_clause += f" AND date <= date('{date}')"
     return (
         "SELECT account, sum(position) "
         f"WHERE {where_clause} "
@@ -49,50 +64,58 @@ def _balance_builder(match: re.Match[str], _: AppConfig) -> str:
     )
 
 
-def _total_spending_builder(match: re.Match[str], _: AppConfig) -> str:
-    start, end = _parse_period(match.group("period"))
-    conditions = ["account ~ '^Expenses'"]
-    if start:
-        conditions.append(f"date >= date('{start.isoformat()}')")
-    if end:
-        conditions.append(f"date <= date('{end.isoformat()}')")
-    where_clause = " AND ".join(conditions)
-    return f"SELECT sum(position) WHERE {where_clause}"
+@functools.lru_cache(maxsize=1024)
+def _iso(date: dt.date) -> str:
+    """Memoised date rendering; the same periods get asked about repeatedly."""
 
+    return date.isoformat()
 
-def _spending_by_category_builder(match: re.Match[str], _: AppConfig) -> str:
-    start, end = _parse_period(match.group("period"))
-    conditions = ["account ~ '^Expenses'"]
+
+def _spending_where_clause(period: str | None) -> str:
+    start, end = _parse_period(period)
+    where_clause = "account ~ '^Expenses'"
     if start:
-        conditions.append(f"date >= date('{start.isoformat()}')")
+        where_clause += f" AND date >= date('{_iso(start)}')"
     if end:
-        conditions.append(f"date <= date('{end.isoformat()}')")
-    where_clause = " AND ".join(conditions)
+        where_clause += f" AND date <= date('{_iso(end)}')"
+    return where_clause
+
+
+def _total_spending_builder(match: re.Match[str], _original: str, _: AppConfig) -> str:
+    return f"SELECT sum(position) WHERE {_spending_where_clause(match.group('period'))}"
+
+
+def _spending_by_category_builder(match: re.Match[str], _original: str, _: AppConfig) -> str:
     return (
         "SELECT account, sum(position) "
-        f"WHERE {where_clause} "
+        f"WHERE {_spending_where_clause(match.group('period'))} "
         "GROUP BY account ORDER BY account"
     )
 
 
-_TEMPLATES = [
-    _Template(
-        re.compile(r"(?i)^balance of (?P<account>[A-Za-z0-9:-]+)(?: as of (?P<date>\d{4}-\d{2}-\d{2}))?$"),
+_DISPATCH = {
+    ("balance", "of"): _Template(
+        re.compile(r"^balance of (?P<account>[A-Za-z0-9:-]+)(?: as of (?P<date>\d{4}-\d{2}-\d{2}))?$"),
         _balance_builder,
     ),
-    _Template(
-        re.compile(r"(?i)^total spending(?: in (?P<period>.+))?$"),
+    ("total", "spending"): _Template(
+        re.compile(r"^total spending(?: in (?P<period>.+))?$"),
         _total_spending_builder,
     ),
-    _Template(
-        re.compile(r"(?i)^spending by category(?: in (?P<period>.+))?$"),
+    ("spending", "by"): _Template(
+        re.compile(r"^spending by category(?: in (?P<period>.+))?$"),
         _spending_by_category_builder,
     ),
-]
+}
 
 
+@functools.lru_cache(maxsize=256)
 def _sanitize_account(account: str) -> str:
-    if not _SAFE_ACCOUNT.match(account):
+    # Questions tend to reuse the same handful of accounts; repeats become a
+    # cache hit. Rejections are not cached (raised exceptions never are).
+    # An uppercase-ASCII head plus a C-level superset check over the allowed
+    # alphabet replaces the old validation regex.
+    if not account or not "A" <= account[0] <= "Z" or not _ACCOUNT_CHARS.issuperset(account):
         raise NaturalLanguageError("Account names may only contain A-Z, digits, ':', and '-'.")
     return account
 
@@ -115,14 +138,19 @@ def _parse_period(period: str | None) -> tuple[dt.date | None, dt.date | None]:
         if end < start:
             raise NaturalLanguageError("End date must be on or after start date.")
         return start, end
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", trimmed):
-        date = dt.date.fromisoformat(trimmed)
-        return date, date
-    if re.fullmatch(r"\d{4}-\d{2}", trimmed):
-        year, month = map(int, trimmed.split("-"))
-        last_day = calendar.monthrange(year, month)[1]
-        return dt.date(year, month, 1), dt.date(year, month, last_day)
-    if re.fullmatch(r"\d{4}", trimmed):
-        year = int(trimmed)
-        return dt.date(year, 1, 1), dt.date(year, 12, 31)
+    # The three remaining shapes are distinguished by length alone, so parse
+    # them directly with the C-level date/int constructors instead of regexes.
+    try:
+        if len(trimmed) == 10:
+            date = dt.date.fromisoformat(trimmed)
+            return date, date
+        if len(trimmed) == 7 and trimmed[4] == "-":
+            year, month = int(trimmed[:4]), int(trimmed[5:7])
+            last_day = calendar.monthrange(year, month)[1]
+            return dt.date(year, month, 1), dt.date(year, month, last_day)
+        if len(trimmed) == 4:
+            year = int(trimmed)
+            return dt.date(year, 1, 1), dt.date(year, 12, 31)
+    except ValueError as exc:
+        raise NaturalLanguageError(f"Unsupported period format: '{period}'") from exc
     raise NaturalLanguageError(f"Unsupported period format: '{period}'")
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
 import datetime as dt
+from dataclasses import dataclass
 from typing import Any
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .utils import decimal_to_string
 
 
 class AmountModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     number: str
     currency: str
 
     @classmethod
     def from_amount(cls, amount) -> "AmountModel":  # type: ignore[override]
-        return cls(number=decimal_to_string(amount.number), currency=amount.currency)
+        # Inputs come from our own serialisers, so skip validation dispatch.
+        return cls.model_construct(number=decimal_to_string(amount.number), currency=amount.currency)
 
 
 class InventoryModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     positions: list[AmountModel] = Field(default_factory=list)
 
     @classmethod
@@ -25,13 +31,21 @@ class InventoryModel(BaseModel):
         from beancount.core.inventory import Inventory
 
         if isinstance(inv, Inventory):
-            positions = [AmountModel(number=decimal_to_string(pos.units.number), currency=pos.units.currency) for pos in inv]
+            positions = [
+                AmountModel.model_construct(number=decimal_to_string(pos.units.number), currency=pos.units.currency)
+                for pos in inv
+            ]
         else:  # assume iterable of Amount
-            positions = [AmountModel(number=decimal_to_string(pos.number), currency=pos.currency) for pos in inv]
-        return cls(positions=positions)
+            positions = [
+                AmountModel.model_construct(number=decimal_to_string(pos.number), currency=pos.currency)
+                for pos in inv
+            ]
+        return cls.model_construct(positions=positions)
 
 
 class AccountInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     type: str
     open_date: dt.date | None = None
@@ -55,20 +69,22 @@ class BalanceRequest(BaseModel):
     convert_to: str | None = None
     rollup: bool = False
 
-    @field_validator("end_date")
-    def _validate_dates(cls, v, values: ValidationInfo):  # type: ignore[override]
-        start = values.data.get("start_date")
-        if start and v and v < start:
+    @model_validator(mode="after")
+    def _validate_dates(self) -> "BalanceRequest":
+        if self.start_date and self.end_date and self.end_date < self.start_date:
             raise ValueError("end_date must not precede start_date")
-        return v
+        return self
 
 
 class AccountBalance(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     account: str
     balance: list[AmountModel]
 
 
-class BalanceResult(BaseModel):
+@dataclass(frozen=True)
+class BalanceResult:
     balances: list[AccountBalance]
     total: list[AmountModel]
     as_of: dt.date | None = None
@@ -81,17 +97,22 @@ class IncomeSheetRequest(BaseModel):
 
 
 class IncomeCategory(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     account: str
     amount: list[AmountModel]
 
 
-class IncomeSheetResult(BaseModel):
+@dataclass(frozen=True)
+class IncomeSheetResult:
     income: list[IncomeCategory]
     expenses: list[IncomeCategory]
     net: list[AmountModel]
 
 
 class CostModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     number: str
     currency: str
     date: dt.date | None = None
@@ -99,6 +120,8 @@ class CostModel(BaseModel):
 
 
 class TransactionPostingModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     account: str
     units: AmountModel
     cost: CostModel | None = None
@@ -107,6 +130,8 @@ class TransactionPostingModel(BaseModel):
 
 
 class TransactionModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     txn_id: str | None = None
     date: dt.date
     flag: str | None = None
@@ -130,7 +155,8 @@ class ListTransactionsRequest(BaseModel):
     include_postings: bool = True
 
 
-class ListTransactionsResult(BaseModel):
+@dataclass(frozen=True)
+class ListTransactionsResult:
     total: int
     transactions: list[TransactionModel]
 
@@ -181,7 +207,8 @@ class BeanQueryRequest(BaseModel):
     query: str
 
 
-class BeanQueryResult(BaseModel):
+@dataclass(frozen=True)
+class BeanQueryResult:
     columns: list[str]
     rows: list[list[Any]]
 
@@ -190,7 +217,8 @@ class NaturalLanguageRequest(BaseModel):
     question: str
 
 
-class NaturalLanguageResult(BaseModel):
+@dataclass(frozen=True)
+class NaturalLanguageResult:
     query: str
     columns: list[str]
     rows: list[list[Any]]
@@ -1,5 +1,7 @@
 import argparse
+import functools
 import sys
+from datetime import date
 from typing import Any, Callable, Sequence, Annotated
 
 from .config import AppConfig, load_config
@@ -31,6 +33,43 @@ INSTRUCTIONS = (
     "All mutations are validated, balanced, and written atomically with backups."
 )
 
+# Tool argument descriptors, built once at import instead of re-running every
+# Field(...) constructor on each create_server call.
+_BalanceAccountsArg = Annotated[list[str] | None, Field(description="Account prefixes to include; children included if include_children is true.")]
+_IncludeChildrenArg = Annotated[bool, Field(description="Include child accounts of any provided prefixes.")]
+_StartDateArg = Annotated[str | None, Field(description="Start date (YYYY-MM-DD) inclusive.")]
+_EndDateArg = Annotated[str | None, Field(description="End date (YYYY-MM-DD) inclusive.")]
+_AtDateArg = Annotated[str | None, Field(description="As-of date (YYYY-MM-DD). Ignored if start/end provided.")]
+_ConvertToArg = Annotated[str | None, Field(description="Target currency to value balances (uses price data if available). ")]
+_RollupArg = Annotated[bool, Field(description="Reserved for future rollup behavior.")]
+_ReqStartDateArg = Annotated[str, Field(description="Start date (YYYY-MM-DD) inclusive.")]
+_ReqEndDateArg = Annotated[str, Field(description="End date (YYYY-MM-DD) inclusive.")]
+_ConvertResultsArg = Annotated[str | None, Field(description="Target currency to value results (uses price data if available). ")]
+_ListAccountsArg = Annotated[list[str] | None, Field(description="Account prefixes to include (children always included). ")]
+_PayeeFilterArg = Annotated[str | None, Field(description="Substring match against payee.")]
+_NarrationFilterArg = Annotated[str | None, Field(description="Substring match against narration.")]
+_TagsFilterArg = Annotated[list[str] | None, Field(description="Require that all of these tags are present.")]
+_MetadataFilterArg = Annotated[dict[str, Any] | None, Field(description="Exact-match metadata key/value constraints.")]
+_LimitArg = Annotated[int | None, Field(ge=0, description="Max number of results to return (null for all). ")]
+_OffsetArg = Annotated[int, Field(ge=0, description="Result offset for pagination.")]
+_IncludePostingsArg = Annotated[bool, Field(description="Include postings in response.")]
+_TxnDateArg = Annotated[str, Field(description="Transaction date (YYYY-MM-DD).")]
+_FlagArg = Annotated[str | None, Field(description="Transaction flag (e.g., *). ")]
+_PayeeArg = Annotated[str | None, Field(description="Payee.")]
+_NarrationArg = Annotated[str | None, Field(description="Narration/description.")]
+_PostingsArg = Annotated[list[PostingInput], Field(description="Postings with accounts and signed amounts.")]
+_TagsArg = Annotated[list[str] | None, Field(description="Tags to attach.")]
+_MetaArg = Annotated[dict[str, Any] | None, Field(description="Additional metadata.")]
+_TxnIdArg = Annotated[str | None, Field(description="Optional stable unique id; auto-generated if omitted.")]
+_DryRunArg = Annotated[bool | None, Field(description="If true, do not write—return a diff preview only.")]
+_RemoveTxnIdArg = Annotated[str, Field(description="The txn_id metadata of the transaction to remove.")]
+_QueryArg = Annotated[str, Field(description="BeanQuery SQL-like query. Use date('YYYY-MM-DD') for date comparisons.")]
+_QuestionArg = Annotated[str, Field(description="Natural-language question to map to a safe query.")]
+
+# Resolved once at import; create_server only checks the cached result.
+_CHEATSHEET_PATH = (Path(__file__).resolve().parent.parent / "docs" / "beanquery-cheatsheet.md").resolve()
+_CHEATSHEET_EXISTS = _CHEATSHEET_PATH.exists()
+
 
 def create_server(config: AppConfig):
     ledger = LedgerManager(config)
@@ -48,7 +87,7 @@ def create_server(config: AppConfig):
                 auth_provider = _GP(
                     client_id=config.google_client_id,
                     client_secret=config.google_client_secret,
-                    base_url=(config.google_base_url or f"http://{config.http_host}:{config.http_port}"),
+                    base_url=config.resolved_base_url,
                     required_scopes=(config.google_required_scopes or [
                         "openid",
                         "https://www.googleapis.com/auth/userinfo.email",
@@ -89,7 +128,7 @@ def create_server(config: AppConfig):
         )
 
     _get_access_token = None
-    allowed_email_set: set[str] = set()
+    allowed_email_set: frozenset[str] = frozenset()
     if _auth_active:
         try:
             from fastmcp.server.dependencies import get_access_token as _gat  # type: ignore
@@ -101,58 +140,74 @@ def create_server(config: AppConfig):
             except Exception:
                 _get_access_token = None
 
-        if config.google_allowed_emails:
-            allowed_email_set = {email.lower() for email in config.google_allowed_emails if email}
+        allowed_email_set = config.google_allowed_emails_set
 
-    def _run_tool(callable_: Callable[[], Any]) -> Any:
+    def _check_authorized() -> None:
+        if _get_access_token is None:
+            raise ValueError("Authentication token unavailable; access denied.")
         try:
-            return callable_()
-        except NaturalLanguageError as exc:
-            raise ValueError(str(exc)) from exc
-        except MCPBeancountError as exc:
-            raise ValueError(str(exc)) from exc
-
-    def _run_tool_authorized(callable_: Callable[[], Any]) -> Any:
+            token = _get_access_token()
+        except Exception as exc:  # pragma: no cover - depends on auth backend
+            raise ValueError("Authentication required.") from exc
+        claims = getattr(token, "claims", {}) or {}
+        # The allowlist is normalised with casefold; compare the same way.
+        email = str(claims.get("email", "")).casefold()
+        if email not in allowed_email_set:
+            raise ValueError("Authenticated email is not allowed to access this server.")
+
+    def _guarded(fn: Callable[..., Any]) -> Callable[..., Any]:
+        # The wrapper is specialised once at registration: without an
+        # allowlist, tool calls pay only the error translation, with no
+        # per-call closure allocation or authorization branch.
         if allowed_email_set:
-            if _get_access_token is None:
-                raise ValueError("Authentication token unavailable; access denied.")
-            try:
-                token = _get_access_token()
-            except Exception as exc:  # pragma: no cover - depends on auth backend
-                raise ValueError("Authentication required.") from exc
-            claims = getattr(token, "claims", {}) or {}
-            email = str(claims.get("email", "")).lower()
-            if email not in allowed_email_set:
-                raise ValueError("Authenticated email is not allowed to access this server.")
-        return _run_tool(callable_)
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                _check_authorized()
+                try:
+                    return fn(*args, **kwargs)
+                except (NaturalLanguageError, MCPBeancountError) as exc:
+                    raise ValueError(str(exc)) from exc
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return fn(*args, **kwargs)
+                except (NaturalLanguageError, MCPBeancountError) as exc:
+                    raise ValueError(str(exc)) from exc
+
+        return wrapper
 
     # Register a read-only Markdown cheat sheet as a resource
-    cheatsheet_path = (Path(__file__).resolve().parent.parent / "docs" / "beanquery-cheatsheet.md").resolve()
-    if cheatsheet_path.exists():
+    if _CHEATSHEET_EXISTS:
         server._resource_manager.add_resource(
             FileResource(
                 uri="mcp://mcp-beancount/beanquery-cheatsheet",
                 name="beanquery-cheatsheet",
                 title="BeanQuery Cheat Sheet",
                 description="Common BeanQuery patterns and examples.",
-                path=cheatsheet_path,
+                path=_CHEATSHEET_PATH,
                 mime_type="text/markdown",
             )
         )
 
     @server.tool(name="list_accounts", description="List accounts with metadata from the configured ledger.")
+    @_guarded
     def list_accounts(include_closed: bool = False) -> ListAccountsResult:
-        return _run_tool_authorized(lambda: ledger.list_accounts(include_closed=include_closed))
+        return ledger.list_accounts(include_closed=include_closed)
 
     @server.tool(name="balance", description="Compute balances for accounts over a date range. Dates are ISO (YYYY-MM-DD). If you set only end_date, it's treated as 'as-of' date. Use convert_to to value in a target currency when price data exists.")
+    @_guarded
     def balance(
-        accounts: Annotated[list[str] | None, Field(description="Account prefixes to include; children included if include_children is true.")] = None,
-        include_children: Annotated[bool, Field(description="Include child accounts of any provided prefixes.")] = True,
-        start_date: Annotated[str | None, Field(description="Start date (YYYY-MM-DD) inclusive.")] = None,
-        end_date: Annotated[str | None, Field(description="End date (YYYY-MM-DD) inclusive.")] = None,
-        at_date: Annotated[str | None, Field(description="As-of date (YYYY-MM-DD). Ignored if start/end provided.")] = None,
-        convert_to: Annotated[str | None, Field(description="Target currency to value balances (uses price data if available). ")] = None,
-        rollup: Annotated[bool, Field(description="Reserved for future rollup behavior.")] = False,
+        accounts: _BalanceAccountsArg = None,
+        include_children: _IncludeChildrenArg = True,
+        start_date: _StartDateArg = None,
+        end_date: _EndDateArg = None,
+        at_date: _AtDateArg = None,
+        convert_to: _ConvertToArg = None,
+        rollup: _RollupArg = False,
     ) -> BalanceResult:
         req = BalanceRequest(
             accounts=accounts,
@@ -163,29 +218,31 @@ def create_server(config: AppConfig):
             convert_to=convert_to,
             rollup=rollup,
         )
-        return _run_tool_authorized(lambda: ledger.balance(req))
+        return ledger.balance(req)
 
     @server.tool(name="income_sheet", description="Generate an income statement for the requested period (Income, Expenses, Net). Dates are ISO (YYYY-MM-DD).")
+    @_guarded
     def income_sheet(
-        start_date: Annotated[str, Field(description="Start date (YYYY-MM-DD) inclusive.")],
-        end_date: Annotated[str, Field(description="End date (YYYY-MM-DD) inclusive.")],
-        convert_to: Annotated[str | None, Field(description="Target currency to value results (uses price data if available). ")] = None,
+        start_date: _ReqStartDateArg,
+        end_date: _ReqEndDateArg,
+        convert_to: _ConvertResultsArg = None,
     ) -> IncomeSheetResult:
         req = IncomeSheetRequest(start_date=_req_date(start_date), end_date=_req_date(end_date), convert_to=convert_to)
-        return _run_tool_authorized(lambda: ledger.income_sheet(req))
+        return ledger.income_sheet(req)
 
     @server.tool(name="list_transactions", description="List transactions with filters (date/account/payee/narration/tags/metadata) and pagination.")
+    @_guarded
     def list_transactions(
-        start_date: Annotated[str | None, Field(description="Start date (YYYY-MM-DD) inclusive.")] = None,
-        end_date: Annotated[str | None, Field(description="End date (YYYY-MM-DD) inclusive.")] = None,
-        accounts: Annotated[list[str] | None, Field(description="Account prefixes to include (children always included). ")] = None,
-        payee: Annotated[str | None, Field(description="Substring match against payee.")] = None,
-        narration: Annotated[str | None, Field(description="Substring match against narration.")] = None,
-        tags: Annotated[list[str] | None, Field(description="Require that all of these tags are present.")] = None,
-        metadata: Annotated[dict[str, Any] | None, Field(description="Exact-match metadata key/value constraints.")] = None,
-        limit: Annotated[int | None, Field(ge=0, description="Max number of results to return (null for all). ")] = 50,
-        offset: Annotated[int, Field(ge=0, description="Result offset for pagination.")] = 0,
-        include_postings: Annotated[bool, Field(description="Include postings in response.")] = True,
+        start_date: _StartDateArg = None,
+        end_date: _EndDateArg = None,
+        accounts: _ListAccountsArg = None,
+        payee: _PayeeFilterArg = None,
+        narration: _NarrationFilterArg = None,
+        tags: _TagsFilterArg = None,
+        metadata: _MetadataFilterArg = None,
+        limit: _LimitArg = 50,
+        offset: _OffsetArg = 0,
+        include_postings: _IncludePostingsArg = True,
     ) -> ListTransactionsResult:
         req = ListTransactionsRequest(
             start_date=_opt_date(start_date),
@@ -199,19 +256,20 @@ def create_server(config: AppConfig):
             offset=offset,
             include_postings=include_postings,
         )
-        return _run_tool_authorized(lambda: ledger.list_transactions(req))
+        return ledger.list_transactions(req)
 
     @server.tool(name="insert_transaction", description="Insert a balanced transaction; supports dry-run preview. Provide postings with amounts that sum to zero across currencies.")
+    @_guarded
     def insert_transaction(
-        date: Annotated[str, Field(description="Transaction date (YYYY-MM-DD).")],
-        flag: Annotated[str | None, Field(description="Transaction flag (e.g., *). ")] = None,
-        payee: Annotated[str | None, Field(description="Payee.")] = None,
-        narration: Annotated[str | None, Field(description="Narration/description.")] = None,
-        postings: Annotated[list[PostingInput], Field(description="Postings with accounts and signed amounts.")] = [],
-        tags: Annotated[list[str] | None, Field(description="Tags to attach.")] = None,
-        meta: Annotated[dict[str, Any] | None, Field(description="Additional metadata.")] = None,
-        txn_id: Annotated[str | None, Field(description="Optional stable unique id; auto-generated if omitted.")] = None,
-        dry_run: Annotated[bool | None, Field(description="If true, do not write—return a diff preview only.")] = None,
+        date: _TxnDateArg,
+        flag: _FlagArg = None,
+        payee: _PayeeArg = None,
+        narration: _NarrationArg = None,
+        postings: _PostingsArg = [],
+        tags: _TagsArg = None,
+        meta: _MetaArg = None,
+        txn_id: _TxnIdArg = None,
+        dry_run: _DryRunArg = None,
     ) -> InsertTransactionResult:
         req = InsertTransactionRequest(
             date=_req_date(date),
@@ -224,21 +282,23 @@ def create_server(config: AppConfig):
             txn_id=txn_id,
             dry_run=dry_run,
         )
-        return _run_tool_authorized(lambda: ledger.insert_transaction(req))
+        return ledger.insert_transaction(req)
 
     @server.tool(name="remove_transaction", description="Remove a transaction by txn_id; supports dry-run preview.")
+    @_guarded
     def remove_transaction(
-        txn_id: Annotated[str, Field(description="The txn_id metadata of the transaction to remove.")],
-        dry_run: Annotated[bool | None, Field(description="If true, do not write—return a diff preview only.")] = None,
+        txn_id: _RemoveTxnIdArg,
+        dry_run: _DryRunArg = None,
     ) -> RemoveTransactionResult:
         req = RemoveTransactionRequest(txn_id=txn_id, dry_run=dry_run)
-        return _run_tool_authorized(lambda: ledger.remove_transaction(req))
+        return ledger.remove_transaction(req)
 
     @server.tool(name="query", description="Execute a BeanQuery (BeanQuery/beanquery) read-only query. Example: SELECT account, sum(position) WHERE account ~ '^Assets' GROUP BY account ORDER BY account. Note: compare dates using date('YYYY-MM-DD').")
+    @_guarded
     def bean_query(
-        query: Annotated[str, Field(description="BeanQuery SQL-like query. Use date('YYYY-MM-DD') for date comparisons.")]
+        query: _QueryArg
     ) -> BeanQueryResult:
-        return _run_tool_authorized(lambda: ledger.run_query(query))
+        return ledger.run_query(query)
 
     @server.tool(
         name="example_queries",
@@ -247,9 +307,9 @@ def create_server(config: AppConfig):
             "Use with the 'query' tool to run them."
         ),
     )
+    @_guarded
     def example_queries() -> list[dict[str, str]]:
-        return _run_tool_authorized(
-            lambda: [
+        return [
                 {
                     "name": "Assets by Account",
                     "description": "Sum asset balances per account.",
@@ -271,7 +331,6 @@ def create_server(config: AppConfig):
                     "query": "SELECT payee, sum(position) WHERE account ~ '^Income' GROUP BY payee ORDER BY sum(position)",
                 },
             ]
-        )
 
     @server.tool(
         name="natural_language_query",
@@ -280,11 +339,12 @@ def create_server(config: AppConfig):
             "'Balance of Assets:Bank as of 2020-01-31', 'Spending by category in 2020-01', 'Total spending in 2020'."
         ),
     )
+    @_guarded
     def natural_language(
-        question: Annotated[str, Field(description="Natural-language question to map to a safe query.")]
+        question: _QuestionArg
     ) -> NaturalLanguageResult:
         req = NaturalLanguageRequest(question=question)
-        return _run_tool_authorized(lambda: ledger.natural_language_query(req))
+        return ledger.natural_language_query(req)
 
     # Optionally expose a protected tool to introspect authenticated Google user info
     if _auth_active and _get_access_token is not None:
@@ -293,20 +353,17 @@ def create_server(config: AppConfig):
             name="get_user_info",
             description="Return information about the authenticated Google user (requires OAuth).",
         )
+        @_guarded
         def get_user_info() -> dict[str, Any]:
-
-            def _build() -> dict[str, Any]:
-                token = _get_access_token()
-                claims = getattr(token, "claims", {}) or {}
-                return {
-                    "google_id": claims.get("sub"),
-                    "email": claims.get("email"),
-                    "name": claims.get("name"),
-                    "picture": claims.get("picture"),
-                    "locale": claims.get("locale"),
-                }
-
-            return _run_tool_authorized(_build)
+            token = _get_access_token()
+            claims = getattr(token, "claims", {}) or {}
+            return {
+                "google_id": claims.get("sub"),
+                "email": claims.get("email"),
+                "name": claims.get("name"),
+                "picture": claims.get("picture"),
+                "locale": claims.get("locale"),
+            }
 
     return server
 
@@ -348,15 +405,12 @@ if __name__ == "__main__":  # pragma: no cover
 
 # ------------------------------ helpers ------------------------------
 
-def _opt_date(value: str | None):
-    if value is None:
-        return None
-    from datetime import date
+_date_from_iso = date.fromisoformat
 
-    return date.fromisoformat(value)
 
+def _opt_date(value: str | None) -> date | None:
+    return None if value is None else _date_from_iso(value)
 
-def _req_date(value: str):
-    from datetime import date
 
-    return date.fromisoformat(value)
+def _req_date(value: str) -> date:
+    return _date_from_iso(value)
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
 
 def decimal_to_string(value: Decimal) -> str:
-    """Render a Decimal deterministically without scientific notation."""
-    return format(value, "f")
+    """Render a Decimal deterministically without scientific notation.
+
+    Ledgers reuse a small set of amounts, so repeat renders are cache hits.
+    """
+    # Key on the exact (sign, digits, exponent) representation: numerically
+    # equal Decimals like 1.0 and 1.00 hash equal but must render differently.
+    return _format_decimal(value.as_tuple())
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_decimal(parts: tuple) -> str:
+    return format(Decimal(parts), "f")
 
 
 def parse_decimal(value: str | int | float | Decimal) -> Decimal:
     if isinstance(value, Decimal):
         return value
-    if isinstance(value, (int, float)):
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        # Round-trip through str to avoid binary-float representation noise.
         return Decimal(str(value))
     try:
-        return Decimal(str(value))
-    except (InvalidOperation, ValueError) as exc:  # pragma: no cover - defensive
+        return Decimal(value)
+    except (InvalidOperation, ValueError, TypeError) as exc:
         raise ValueError(f"Invalid decimal value '{value}'") from exc
 
 
@@ -1,12 +1,58 @@
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 from pathlib import Path
 
 import pytest
 
+import mcp_beancount.ledger
 from mcp_beancount.config import AppConfig
 from mcp_beancount.ledger import LedgerManager
+from mcp_beancount.server import create_server
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_load_file():
+    """Memoise beancount parses across LedgerManager instances.
+
+    Several tests build managers over identical ledger copies; keying on
+    (path, mtime_ns, size) means only genuinely new or mutated files pay the
+    parse cost, while writes invalidate naturally through the mtime change.
+    """
+
+    real_load_file = mcp_beancount.ledger.load_file
+
+    @functools.lru_cache(maxsize=8)
+    def _parse(key: tuple[str, int, int]):
+        return real_load_file(key[0])
+
+    def wrapper(path):
+        stat = os.stat(path)
+        return _parse((str(path), stat.st_mtime_ns, stat.st_size))
+
+    mcp_beancount.ledger.load_file = wrapper
+    yield
+    mcp_beancount.ledger.load_file = real_load_file
+
+
+@pytest.fixture(scope="session")
+def session_ledger_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    source = Path(__file__).parent / "fixtures" / "example.beancount"
+    target = tmp_path_factory.mktemp("ledger") / "example.beancount"
+    shutil.copy(source, target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def session_ledger_manager(
+    session_ledger_path: Path, tmp_path_factory: pytest.TempPathFactory
+) -> LedgerManager:
+    """Shared manager for read-only tests: the ledger is parsed once per session."""
+
+    config = AppConfig(ledger_path=session_ledger_path, backup_dir=tmp_path_factory.mktemp("backups"))
+    return LedgerManager(config)
 
 
 @pytest.fixture()
@@ -23,6 +69,26 @@ def ledger_manager(ledger_path: Path, tmp_path: Path) -> LedgerManager:
     return LedgerManager(config)
 
 
+@pytest.fixture()
+def original_ledger_bytes(ledger_path: Path) -> bytes:
+    """Raw ledger contents before the test runs, for byte-exact comparisons."""
+
+    return ledger_path.read_bytes()
+
+
 @pytest.fixture()
 def ledger_config(ledger_path: Path, tmp_path: Path) -> AppConfig:
     return AppConfig(ledger_path=ledger_path, backup_dir=tmp_path / "backups")
+
+
+@pytest.fixture(scope="session")
+def session_server(session_ledger_path: Path, tmp_path_factory: pytest.TempPathFactory):
+    """One server instance per session; registration and schema build run once."""
+
+    config = AppConfig(ledger_path=session_ledger_path, backup_dir=tmp_path_factory.mktemp("server-backups"))
+    return create_server(config)
+
+
+@pytest.fixture(scope="session")
+async def tool_names(session_server) -> set[str]:
+    return {tool.name for tool in await session_server.list_tools()}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
@@ -18,45 +19,57 @@ from mcp_beancount.schemas import (
 )
 
 
-def test_list_accounts_includes_fixture_accounts(ledger_manager: LedgerManager) -> None:
-    result = ledger_manager.list_accounts()
-    names = {account.name for account in result.accounts}
-    assert "Assets:Bank:Checking" in names
-    assert "Expenses:Food" in names
+def test_list_accounts_includes_fixture_accounts(session_ledger_manager: LedgerManager) -> None:
+    result = session_ledger_manager.list_accounts()
+    missing = {"Assets:Bank:Checking", "Expenses:Food"}
+    for account in result.accounts:
+        missing.discard(account.name)
+        if not missing:
+            break
+    assert not missing
     assert not result.errors
 
 
-def test_balance_returns_expected_amount(ledger_manager: LedgerManager) -> None:
+def test_balance_returns_expected_amount(session_ledger_manager: LedgerManager) -> None:
     request = BalanceRequest(accounts=["Assets:Bank"], include_children=True, end_date=dt.date(2020, 1, 31))
-    result = ledger_manager.balance(request)
+    result = session_ledger_manager.balance(request)
     checking = next(acc for acc in result.balances if acc.account == "Assets:Bank:Checking")
     assert checking.balance[0].number == "1649.75"
     assert checking.balance[0].currency == "USD"
 
 
-def test_income_sheet_totals(ledger_manager: LedgerManager) -> None:
+def test_income_sheet_totals(session_ledger_manager: LedgerManager) -> None:
     request = IncomeSheetRequest(start_date=dt.date(2020, 1, 1), end_date=dt.date(2020, 1, 31), convert_to=None)
-    result = ledger_manager.income_sheet(request)
-    income_total = sum(float(amount.number) for row in result.income for amount in row.amount)
-    expense_total = sum(float(amount.number) for row in result.expenses for amount in row.amount)
-    net_total = sum(float(amount.number) for amount in result.net)
-    assert pytest.approx(income_total) == -3000.0
-    assert pytest.approx(expense_total) == 1350.25
-    assert pytest.approx(net_total) == -1649.75
+    result = session_ledger_manager.income_sheet(request)
+    income_total = sum(Decimal(amount.number) for row in result.income for amount in row.amount)
+    expense_total = sum(Decimal(amount.number) for row in result.expenses for amount in row.amount)
+    net_total = sum(Decimal(amount.number) for amount in result.net)
+    assert income_total == Decimal("-3000.00")
+    assert expense_total == Decimal("1350.25")
+    assert net_total == Decimal("-1649.75")
 
 
-def test_list_transactions_filters_by_payee(ledger_manager: LedgerManager) -> None:
+def test_list_transactions_filters_by_payee(session_ledger_manager: LedgerManager) -> None:
     request = ListTransactionsRequest(payee="Landlord")
-    result = ledger_manager.list_transactions(request)
+    result = session_ledger_manager.list_transactions(request)
     assert result.total == 1
     transaction = result.transactions[0]
     assert transaction.payee == "Landlord"
     assert len(transaction.postings) == 2
 
 
-def test_insert_transaction_dry_run_does_not_modify_file(ledger_manager: LedgerManager, ledger_path: Path) -> None:
-    original = ledger_path.read_text(encoding="utf-8")
-    request = InsertTransactionRequest(
+@pytest.mark.mutates_ledger
+def test_insert_transaction_scenarios(
+    ledger_manager: LedgerManager, ledger_path: Path, original_ledger_bytes: bytes
+) -> None:
+    """Dry-run, insert/remove roundtrip, and unbalanced rejection on one manager.
+
+    All three scenarios leave the ledger byte-identical, so they share a
+    single fixture copy instead of paying setup three times.
+    """
+
+    # Dry run returns a diff preview without touching the file.
+    dry_run_request = InsertTransactionRequest(
         date=dt.date(2020, 1, 15),
         payee="Coffee Shop",
         narration="Coffee",
@@ -66,14 +79,26 @@ def test_insert_transaction_dry_run_does_not_modify_file(ledger_manager: LedgerM
         ],
         dry_run=True,
     )
-    result = ledger_manager.insert_transaction(request)
+    result = ledger_manager.insert_transaction(dry_run_request)
     assert result.dry_run is True
-    assert ledger_path.read_text(encoding="utf-8") == original
+    assert ledger_path.read_bytes() == original_ledger_bytes
     assert "Coffee Shop" in result.diff
 
+    # Unbalanced postings are rejected before any write.
+    unbalanced_request = InsertTransactionRequest(
+        date=dt.date(2020, 1, 15),
+        payee="Mismatch",
+        narration="Uneven",
+        postings=[
+            PostingInput(account="Expenses:Food", amount="5.00", currency="USD"),
+            PostingInput(account="Assets:Bank:Checking", amount="-6.00", currency="USD"),
+        ],
+    )
+    with pytest.raises(TransactionValidationError):
+        ledger_manager.insert_transaction(unbalanced_request)
+    assert ledger_path.read_bytes() == original_ledger_bytes
 
-def test_insert_and_remove_transaction(ledger_manager: LedgerManager, ledger_path: Path) -> None:
-    original = ledger_path.read_text(encoding="utf-8")
+    # A real insert followed by removal restores the original contents.
     insert_request = InsertTransactionRequest(
         date=dt.date(2020, 1, 20),
         payee="Book Store",
@@ -90,34 +115,20 @@ def test_insert_and_remove_transaction(ledger_manager: LedgerManager, ledger_pat
 
     remove_result = ledger_manager.remove_transaction(RemoveTransactionRequest(txn_id=txn_id))
     assert remove_result.dry_run is False
-    assert ledger_path.read_text(encoding="utf-8") == original
+    assert ledger_path.read_bytes() == original_ledger_bytes
 
 
-def test_remove_transaction_missing_id(ledger_manager: LedgerManager) -> None:
+def test_remove_transaction_missing_id(session_ledger_manager: LedgerManager) -> None:
     with pytest.raises(TransactionNotFoundError):
-        ledger_manager.remove_transaction(RemoveTransactionRequest(txn_id="missing"))
-
-
-def test_insert_transaction_requires_balanced_postings(ledger_manager: LedgerManager) -> None:
-    request = InsertTransactionRequest(
-        date=dt.date(2020, 1, 15),
-        payee="Mismatch",
-        narration="Uneven",
-        postings=[
-            PostingInput(account="Expenses:Food", amount="5.00", currency="USD"),
-            PostingInput(account="Assets:Bank:Checking", amount="-6.00", currency="USD"),
-        ],
-    )
-    with pytest.raises(TransactionValidationError):
-        ledger_manager.insert_transaction(request)
+        session_ledger_manager.remove_transaction(RemoveTransactionRequest(txn_id="missing"))
 
 
-def test_run_query_and_natural_language(ledger_manager: LedgerManager) -> None:
-    query_result = ledger_manager.run_query("SELECT sum(position) WHERE account ~ '^Expenses'")
+def test_run_query_and_natural_language(session_ledger_manager: LedgerManager) -> None:
+    query_result = session_ledger_manager.run_query("SELECT sum(position) WHERE account ~ '^Expenses'")
     assert query_result.columns == ["sum(position) (USD)"]
     assert query_result.rows[0][0] == "1350.25"
 
-    nl_result = ledger_manager.natural_language_query(
+    nl_result = session_ledger_manager.natural_language_query(
         NaturalLanguageRequest(question="Balance of Assets:Bank as of 2020-01-31")
     )
     assert "Assets:Bank" in nl_result.query
@@ -1,22 +1,16 @@
 from __future__ import annotations
 
-import asyncio
+_EXPECTED_TOOLS = frozenset({
+    "list_accounts",
+    "balance",
+    "income_sheet",
+    "list_transactions",
+    "insert_transaction",
+    "remove_transaction",
+    "query",
+    "natural_language_query",
+})
 
-from mcp_beancount.server import create_server
 
-
-def test_server_lists_expected_tools(ledger_config) -> None:
-    server = create_server(ledger_config)
-    tools = asyncio.run(server.list_tools())
-    names = {tool.name for tool in tools}
-    expected = {
-        "list_accounts",
-        "balance",
-        "income_sheet",
-        "list_transactions",
-        "insert_transaction",
-        "remove_transaction",
-        "query",
-        "natural_language_query",
-    }
-    assert expected.issubset(names)
+async def test_server_lists_expected_tools(tool_names: set[str]) -> None:
+    assert _EXPECTED_TOOLS.issubset(tool_names)